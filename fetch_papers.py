@@ -6,22 +6,110 @@ Usage:
     python fetch_papers.py keyword1 keyword2 ...
     python fetch_papers.py "machine learning" "deep learning"
     python fetch_papers.py cat:cs.AI  # Search by category
+    python fetch_papers.py --group "machine learning" --group cat:cs.AI  # One request, several searches
+    python fetch_papers.py --parallel --group "machine learning" --group cat:cs.AI  # Concurrent requests
+    python fetch_papers.py --pretty "machine learning"  # Readable papers.json instead of papers.json.gz
 """
 
+import argparse
+import asyncio
+import gzip
+import hashlib
+import io
+import os
+import re
 import sys
 import json
-import xml.etree.ElementTree as ET
+import logging
+from collections.abc import Iterable, Mapping
 from datetime import datetime
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree  # type: ignore[import-untyped]
+import msgspec
+
+from paper import Paper
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None  # type: ignore[assignment]
+
+
+log = logging.getLogger(__name__)
 
 
 # arXiv API configuration
 ARXIV_API_URL = "http://export.arxiv.org/api/query"
 MAX_RESULTS = 20
+REQUEST_TIMEOUT = 30
+CACHE_DIR = '.arxiv_cache'
+HTTP_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': 'arxiv-fetch/1.0'
+}
+
+# Retry policy for throttled / failing requests, shared by both fetch paths
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+
+# Maximum number of arXiv requests in flight at once with --parallel
+PARALLEL_LIMIT = 4
+
+# arXiv timestamp format and the human-readable format written to papers.json
+ARXIV_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+DISPLAY_DATE_FORMAT = '%B %d, %Y'
+
+# Shared HTTP session: keeps connections alive and retries transient errors
+_SESSION = requests.Session()
+_SESSION.headers.update(HTTP_HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=PARALLEL_LIMIT,
+    pool_maxsize=PARALLEL_LIMIT,
+    max_retries=Retry(total=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR,
+                      status_forcelist=RETRY_STATUSES)
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
 
+# Reused JSON encoder for papers.json
+_ENCODER = msgspec.json.Encoder()
 
-def build_query(keywords):
+# Whitespace runs inside titles and abstracts
+_WS_RE = re.compile(r'\s+')
+
+# XML namespaces used by the arXiv Atom feed
+NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+
+# Entry tag in Clark notation, used to filter iterparse events
+ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+
+# Per-entry field lookups, compiled once at import; plain str results keep
+# no reference back to the (cleared) entry element
+_ID = etree.XPath('atom:id/text()', namespaces=NS, smart_strings=False)
+_TITLE = etree.XPath('atom:title/text()', namespaces=NS, smart_strings=False)
+_AUTHORS = etree.XPath('atom:author/atom:name/text()', namespaces=NS, smart_strings=False)
+_SUMMARY = etree.XPath('atom:summary/text()', namespaces=NS, smart_strings=False)
+_PUBLISHED = etree.XPath('atom:published/text()', namespaces=NS, smart_strings=False)
+
+
+def _norm(text: str) -> str:
+    """Collapse runs of whitespace to single spaces and strip the ends."""
+    return _WS_RE.sub(' ', text).strip() if text else text
+
+
+def build_query(keywords: list[str]) -> str:
     """
     Build arXiv API query from keywords.
     
@@ -35,51 +123,266 @@ def build_query(keywords):
         # Default to recent machine learning papers
         return "cat:cs.LG OR cat:cs.AI OR cat:stat.ML"
     
-    # Check if using category search (e.g., cat:cs.AI)
-    if any(kw.startswith("cat:") for kw in keywords):
-        # Join categories with OR
-        return " OR ".join(keywords)
+    # Build full-text terms in the same pass that checks for categories
+    query_terms = []
+    for kw in keywords:
+        # Category search (e.g., cat:cs.AI): join keywords with OR
+        if kw.startswith("cat:"):
+            return " OR ".join(keywords)
+        query_terms.append(f'all:"{kw}"')
     
     # Otherwise, do full-text search
     # Join keywords with AND for more specific results
-    query_terms = [f'all:"{kw}"' for kw in keywords]
     return " AND ".join(query_terms)
 
 
-def fetch_arxiv_papers(keywords, max_results=MAX_RESULTS):
+def build_group_query(groups: list[list[str]]) -> str:
     """
-    Fetch papers from arXiv API based on keywords.
+    Build a single arXiv API query covering several keyword groups.
+    
+    Each group is built with build_query and the groups are OR-joined,
+    so several searches can be answered by one request.
     
     Args:
-        keywords: List of search keywords
-        max_results: Maximum number of papers to fetch
+        groups: List of keyword lists
         
     Returns:
-        XML response text from arXiv API
+        Query string for arXiv API
     """
-    query = build_query(keywords)
+    return " OR ".join(f"({build_query(group)})" for group in groups)
+
+
+def build_params(query: str, max_results: int = MAX_RESULTS) -> dict[str, str | int]:
+    """
+    Build arXiv API request parameters for a query.
     
-    params = {
+    Args:
+        query: Query string built by build_query or build_group_query
+        max_results: Maximum number of papers to fetch
+        
+    Returns:
+        Dictionary of URL query parameters
+    """
+    return {
         'search_query': query,
         'start': 0,
         'max_results': max_results,
         'sortBy': 'submittedDate',
         'sortOrder': 'descending'
     }
+
+
+def _cache_paths(params: dict[str, str | int]) -> tuple[str, str]:
+    """
+    Get the cached XML and metadata paths for a set of request parameters.
+    
+    Args:
+        params: Request parameters from build_params
+        
+    Returns:
+        Tuple of (xml_path, meta_path)
+    """
+    key = hashlib.blake2b(urlencode(params).encode('utf-8'), digest_size=8).hexdigest()
+    base = os.path.join(CACHE_DIR, key)
+    return f"{base}.xml", f"{base}.meta.json"
+
+
+def conditional_headers(params: dict[str, str | int]) -> dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers from a cached response.
+    
+    Args:
+        params: Request parameters from build_params
+        
+    Returns:
+        Dictionary of headers, empty if nothing usable is cached
+    """
+    xml_path, meta_path = _cache_paths(params)
+    if not os.path.exists(xml_path):
+        return {}
+    
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (IOError, ValueError):
+        return {}
+    
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+
+def read_cached_response(params: dict[str, str | int]) -> str:
+    """
+    Read the cached XML response for a set of request parameters.
+    
+    Args:
+        params: Request parameters from build_params
+        
+    Returns:
+        Cached XML response text
+    """
+    xml_path, _ = _cache_paths(params)
+    with open(xml_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def save_cached_response(params: dict[str, str | int], xml_text: str,
+                         headers: Mapping[str, str]) -> None:
+    """
+    Cache an XML response along with its validators.
+    
+    Responses without an ETag or Last-Modified header are not cached,
+    since they can never be revalidated.
+    
+    Args:
+        params: Request parameters from build_params
+        xml_text: XML response text
+        headers: Response headers
+    """
+    meta = {
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified')
+    }
+    if not meta['etag'] and not meta['last_modified']:
+        return
+    
+    xml_path, meta_path = _cache_paths(params)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(xml_path, 'w', encoding='utf-8') as f:
+            f.write(xml_text)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    except IOError as e:
+        log.warning("Warning: could not cache response: %s", e)
+
+
+def fetch_arxiv_papers(query: str, max_results: int = MAX_RESULTS) -> str:
+    """
+    Fetch papers from arXiv API for a query.
+    
+    Args:
+        query: Query string built by build_query or build_group_query
+        max_results: Maximum number of papers to fetch
+        
+    Returns:
+        XML response text from arXiv API
+    """
+    log.info("Querying arXiv API with: %s", query)
+    log.info("Fetching up to %d papers...", max_results)
     
-    print(f"Querying arXiv API with: {query}")
-    print(f"Fetching up to {max_results} papers...")
+    params = build_params(query, max_results)
     
     try:
-        response = requests.get(ARXIV_API_URL, params=params, timeout=30)
+        response = _SESSION.get(ARXIV_API_URL, params=params,
+                                headers=conditional_headers(params), timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            log.info("Feed not modified, using cached response")
+            return read_cached_response(params)
         response.raise_for_status()
+        save_cached_response(params, response.text, response.headers)
         return response.text
     except requests.RequestException as e:
-        print(f"Error fetching from arXiv API: {e}")
+        log.error("Error fetching from arXiv API: %s", e)
         sys.exit(1)
 
 
-def parse_arxiv_response(xml_text):
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """
+    Get the backoff delay before retrying a throttled request.
+    
+    Args:
+        attempt: Number of retries already made
+        retry_after: Retry-After header value, if any
+        
+    Returns:
+        Delay in seconds
+    """
+    delay: float = BACKOFF_FACTOR * 2 ** attempt
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+async def fetch_all(queries: list[str], max_results: int = MAX_RESULTS) -> list[str]:
+    """
+    Fetch several arXiv queries concurrently with aiohttp.
+    
+    At most PARALLEL_LIMIT requests run at once, and RETRY_STATUSES responses
+    are retried with backoff like the requests session does.
+    
+    Args:
+        queries: List of query strings
+        max_results: Maximum number of papers to fetch per query
+        
+    Returns:
+        List of XML response texts, in the same order as queries
+    """
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    limit = asyncio.Semaphore(PARALLEL_LIMIT)
+    
+    async with aiohttp.ClientSession(timeout=timeout, headers=HTTP_HEADERS) as session:
+        async def fetch(query: str) -> str:
+            params = build_params(query, max_results)
+            attempt = 0
+            async with limit:
+                log.info("Querying arXiv API with: %s", query)
+                while True:
+                    async with session.get(ARXIV_API_URL, params=params,
+                                           headers=conditional_headers(params)) as response:
+                        if response.status == 304:
+                            log.info("Feed not modified, using cached response")
+                            return read_cached_response(params)
+                        if response.status not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                            response.raise_for_status()
+                            xml_text = await response.text()
+                            save_cached_response(params, xml_text, response.headers)
+                            return xml_text
+                        delay = _retry_delay(attempt, response.headers.get('Retry-After'))
+                    
+                    log.info("arXiv returned %d for %s, retrying in %.1fs",
+                             response.status, query, delay)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+        
+        # Let every fetch finish before the session closes
+        results = await asyncio.gather(*(fetch(query) for query in queries),
+                                       return_exceptions=True)
+    
+    xml_texts: list[str] = []
+    for result in results:
+        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+            log.error("Error fetching from arXiv API: %s", result)
+            sys.exit(1)
+        if isinstance(result, BaseException):
+            raise result
+        xml_texts.append(result)
+    return xml_texts
+
+
+def fetch_all_papers(queries: list[str], max_results: int = MAX_RESULTS) -> list[str]:
+    """
+    Fetch several arXiv queries, concurrently when aiohttp is installed.
+    
+    Args:
+        queries: List of query strings
+        max_results: Maximum number of papers to fetch per query
+        
+    Returns:
+        List of XML response texts, in the same order as queries
+    """
+    if aiohttp is None:
+        return [fetch_arxiv_papers(query, max_results) for query in queries]
+    
+    log.info("Fetching up to %d papers per query from %d queries...", max_results, len(queries))
+    return asyncio.run(fetch_all(queries, max_results))
+
+
+def parse_arxiv_response(xml_text: str) -> list[Paper]:
     """
     Parse arXiv API XML response and extract paper information.
     
@@ -87,133 +390,247 @@ def parse_arxiv_response(xml_text):
         xml_text: XML response from arXiv API
         
     Returns:
-        List of paper dictionaries
+        List of Paper structs
     """
-    # Define XML namespaces
-    namespaces = {
-        'atom': 'http://www.w3.org/2005/Atom',
-        'arxiv': 'http://arxiv.org/schemas/atom'
-    }
+    papers: list[Paper] = []
+    seen_ids: set[str] = set()
+    
+    # Stream <entry> elements one at a time instead of building the whole tree
+    context = etree.iterparse(io.BytesIO(xml_text.encode('utf-8')), tag=ATOM_ENTRY)
     
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
-        print(f"Error parsing XML: {e}")
+        for _, entry in context:
+            # Extract paper ID from the entry ID URL
+            entry_id: str = _ID(entry)[0]
+            paper_id = entry_id.split('/abs/')[-1]
+            
+            # Skip papers already matched by another keyword group
+            if paper_id in seen_ids:
+                entry.clear()
+                continue
+            seen_ids.add(paper_id)
+            
+            # Extract title (clean up whitespace)
+            title_text: list[str] = _TITLE(entry)
+            title = _norm(title_text[0]) if title_text else "No title"
+            
+            # Extract authors
+            authors: list[str] = list(_AUTHORS(entry))
+            
+            # Extract abstract (clean up whitespace)
+            summary_text: list[str] = _SUMMARY(entry)
+            abstract = _norm(summary_text[0]) if summary_text else "No abstract"
+            
+            # Extract published date
+            published_text: list[str] = _PUBLISHED(entry)
+            published_date = published_text[0] if published_text else "Unknown"
+            
+            # Format date to be more readable
+            try:
+                if parse_datetime is not None:
+                    dt = parse_datetime(published_date)
+                else:
+                    dt = datetime.strptime(published_date, ARXIV_DATE_FORMAT)
+                formatted_date = dt.strftime(DISPLAY_DATE_FORMAT)
+            except ValueError:
+                formatted_date = published_date
+            
+            # Construct PDF link
+            pdf_link = f"http://arxiv.org/pdf/{paper_id}.pdf"
+            
+            # Construct arXiv page link
+            arxiv_link = f"http://arxiv.org/abs/{paper_id}"
+            
+            paper = Paper(
+                id=paper_id,
+                title=title,
+                authors=authors,
+                abstract=abstract,
+                published=formatted_date,
+                published_raw=published_date,
+                pdf_link=pdf_link,
+                arxiv_link=arxiv_link
+            )
+            
+            papers.append(paper)
+            
+            # Free the parsed entry and any already-processed siblings
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    except etree.XMLSyntaxError as e:
+        log.error("Error parsing XML: %s", e)
         sys.exit(1)
     
-    papers = []
-    entries = root.findall('atom:entry', namespaces)
-    
-    print(f"Found {len(entries)} papers")
-    
-    for entry in entries:
-        # Extract paper ID from the entry ID URL
-        entry_id = entry.find('atom:id', namespaces).text
-        paper_id = entry_id.split('/abs/')[-1]
-        
-        # Extract title (clean up whitespace)
-        title_elem = entry.find('atom:title', namespaces)
-        title = ' '.join(title_elem.text.split()) if title_elem is not None else "No title"
-        
-        # Extract authors
-        authors = []
-        for author in entry.findall('atom:author', namespaces):
-            name_elem = author.find('atom:name', namespaces)
-            if name_elem is not None:
-                authors.append(name_elem.text)
-        
-        # Extract abstract (clean up whitespace)
-        summary_elem = entry.find('atom:summary', namespaces)
-        abstract = ' '.join(summary_elem.text.split()) if summary_elem is not None else "No abstract"
-        
-        # Extract published date
-        published_elem = entry.find('atom:published', namespaces)
-        published_date = published_elem.text if published_elem is not None else "Unknown"
-        
-        # Format date to be more readable
-        try:
-            dt = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-            formatted_date = dt.strftime('%B %d, %Y')
-        except:
-            formatted_date = published_date
-        
-        # Construct PDF link
-        pdf_link = f"http://arxiv.org/pdf/{paper_id}.pdf"
-        
-        # Construct arXiv page link
-        arxiv_link = f"http://arxiv.org/abs/{paper_id}"
-        
-        paper = {
-            'id': paper_id,
-            'title': title,
-            'authors': authors,
-            'abstract': abstract,
-            'published': formatted_date,
-            'published_raw': published_date,
-            'pdf_link': pdf_link,
-            'arxiv_link': arxiv_link
-        }
-        
-        papers.append(paper)
+    log.info("Found %d papers", len(papers))
     
     return papers
 
 
-def save_papers_to_json(papers, filename='papers.json'):
+def _published_sort_key(paper: Paper) -> tuple[bool, datetime]:
+    """
+    Sort key ordering papers by published date, unparseable dates last.
+    
+    Args:
+        paper: Paper struct
+        
+    Returns:
+        Tuple of (has_valid_date, published datetime)
+    """
+    try:
+        return True, datetime.strptime(paper.published_raw, ARXIV_DATE_FORMAT)
+    except ValueError:
+        return False, datetime.min
+
+
+def merge_papers(paper_lists: Iterable[list[Paper]]) -> list[Paper]:
+    """
+    Merge papers parsed from several responses.
+    
+    Args:
+        paper_lists: Iterable of Paper struct lists
+        
+    Returns:
+        List of unique papers, newest first, with unparseable dates at the end
+    """
+    merged: dict[str, Paper] = {}
+    for papers in paper_lists:
+        for paper in papers:
+            merged.setdefault(paper.id, paper)
+    
+    return sorted(merged.values(), key=_published_sort_key, reverse=True)
+
+
+def write_papers_json(f: io.BufferedIOBase, papers: list[Paper], last_updated: str,
+                      pretty: bool = False) -> None:
+    """
+    Stream the papers.json document to an open binary file.
+    
+    The header fields are written first, then each paper is encoded and
+    written on its own, so the full document is never held in memory. The
+    layout matches encoding a PapersFile, indented by two spaces if pretty.
+    
+    Args:
+        f: Binary file object to write to
+        papers: List of Paper structs
+        last_updated: ISO timestamp for the last_updated field
+        pretty: Write indented JSON instead of compact JSON
+    """
+    encode = _ENCODER.encode
+    header = (encode(last_updated), encode(len(papers)))
+    
+    if pretty:
+        f.write(b'{\n  "last_updated": %s,\n  "count": %s,\n  "papers": [' % header)
+        sep = b'\n    '
+        for i, paper in enumerate(papers):
+            f.write(b',' + sep if i else sep)
+            f.write(msgspec.json.format(encode(paper), indent=2).replace(b'\n', sep))
+        f.write(b'\n  ]\n}' if papers else b']\n}')
+    else:
+        f.write(b'{"last_updated":%s,"count":%s,"papers":[' % header)
+        buf = bytearray()
+        for i, paper in enumerate(papers):
+            if i:
+                f.write(b',')
+            _ENCODER.encode_into(paper, buf)
+            f.write(buf)
+        f.write(b']}')
+
+
+def save_papers_to_json(papers: list[Paper], filename: str = 'papers.json',
+                        pretty: bool = False) -> None:
     """
     Save papers to JSON file.
     
+    By default the compact JSON is written gzip-compressed to filename + '.gz',
+    which generate_page.py reads directly. With pretty=True an indented,
+    uncompressed file is written to filename instead.
+    
     Args:
-        papers: List of paper dictionaries
+        papers: List of Paper structs
         filename: Output JSON filename
+        pretty: Write indented plain JSON instead of gzip
     """
-    output = {
-        'last_updated': datetime.now().isoformat(),
-        'count': len(papers),
-        'papers': papers
-    }
+    last_updated = datetime.now().isoformat()
+    if not pretty:
+        filename += '.gz'
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
-        print(f"\nSuccessfully saved {len(papers)} papers to {filename}")
+        if pretty:
+            with open(filename, 'wb') as f:
+                write_papers_json(f, papers, last_updated, pretty=True)
+        else:
+            with gzip.open(filename, 'wb', compresslevel=1) as gz:
+                write_papers_json(gz, papers, last_updated)
+        log.info("\nSuccessfully saved %d papers to %s", len(papers), filename)
     except IOError as e:
-        print(f"Error saving to {filename}: {e}")
+        log.error("Error saving to %s: %s", filename, e)
         sys.exit(1)
 
 
-def main():
+def main() -> None:
     """Main function to fetch and save arXiv papers."""
-    # Get keywords from command-line arguments
-    keywords = sys.argv[1:] if len(sys.argv) > 1 else []
+    parser = argparse.ArgumentParser(prog="fetch_papers.py", description="Fetch latest papers from arXiv API")
+    parser.add_argument('keywords', nargs='*', help="search keywords or cat: categories")
+    parser.add_argument('--group', action='append', nargs='+', default=[], metavar='KEYWORD',
+                        help="keyword group to OR into the same request (repeatable)")
+    parser.add_argument('--pretty', action='store_true',
+                        help="write indented papers.json instead of gzipped papers.json.gz")
+    parser.add_argument('--parallel', action='store_true',
+                        help="fetch each keyword group as its own concurrent request")
+    args = parser.parse_args()
     
-    if not keywords:
-        print("No keywords provided. Using default: machine learning, AI, and statistics papers")
-        print("\nUsage: python fetch_papers.py keyword1 keyword2 ...")
-        print("Example: python fetch_papers.py 'machine learning' 'neural networks'")
-        print("Example: python fetch_papers.py cat:cs.AI cat:cs.LG\n")
+    # Progress goes to stderr through a single logging handler
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
-    # Fetch papers from arXiv
-    xml_response = fetch_arxiv_papers(keywords, MAX_RESULTS)
+    # Get keywords from command-line arguments
+    keywords = args.keywords
+    groups = args.group
+    if keywords and groups:
+        groups = [keywords] + groups
+    
+    if not keywords and not groups:
+        log.info("No keywords provided. Using default: machine learning, AI, and statistics papers")
+        log.info("\nUsage: python fetch_papers.py keyword1 keyword2 ...")
+        log.info("Example: python fetch_papers.py 'machine learning' 'neural networks'")
+        log.info("Example: python fetch_papers.py cat:cs.AI cat:cs.LG")
+        log.info("Example: python fetch_papers.py --group 'machine learning' --group cat:cs.AI\n")
     
-    # Parse the XML response
-    papers = parse_arxiv_response(xml_response)
+    if args.parallel and len(groups) > 1:
+        # One request per keyword group, fetched concurrently
+        queries = [build_query(group) for group in groups]
+        xml_responses = fetch_all_papers(queries, MAX_RESULTS)
+        papers = merge_papers(parse_arxiv_response(xml) for xml in xml_responses)
+    else:
+        # Batch keyword groups into one request, scaling the result limit to match
+        if groups:
+            query = build_group_query(groups)
+            max_results = MAX_RESULTS * len(groups)
+        else:
+            query = build_query(keywords)
+            max_results = MAX_RESULTS
+        
+        # Fetch papers from arXiv
+        xml_response = fetch_arxiv_papers(query, max_results)
+        
+        # Parse the XML response
+        papers = parse_arxiv_response(xml_response)
     
     if not papers:
-        print("No papers found!")
+        log.error("No papers found!")
         sys.exit(1)
     
     # Save to JSON
-    save_papers_to_json(papers)
+    save_papers_to_json(papers, pretty=args.pretty)
     
     # Print summary
-    print("\n" + "="*60)
-    print("SUMMARY")
-    print("="*60)
-    print(f"Total papers fetched: {len(papers)}")
-    print(f"First paper: {papers[0]['title'][:60]}...")
-    print(f"Latest published: {papers[0]['published']}")
-    print("="*60)
+    log.info("\n" + "="*60)
+    log.info("SUMMARY")
+    log.info("="*60)
+    log.info("Total papers fetched: %d", len(papers))
+    log.info("First paper: %s...", papers[0].title[:60])
+    log.info("Latest published: %s", papers[0].published)
+    log.info("="*60)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,27 @@
+"""
+paper.py - Typed schema for papers.json
+
+Shared by fetch_papers.py (writer) and generate_page.py (reader) so both
+sides encode and decode the same structs instead of plain dictionaries.
+"""
+
+import msgspec
+
+
+class Paper(msgspec.Struct):
+    """A single arXiv paper."""
+    id: str
+    title: str
+    authors: list[str]
+    abstract: str
+    published: str
+    published_raw: str
+    pdf_link: str
+    arxiv_link: str
+
+
+class PapersFile(msgspec.Struct):
+    """Top-level contents of papers.json."""
+    last_updated: str
+    count: int
+    papers: list[Paper]